@@ -3,46 +3,121 @@ from tkinter import scrolledtext, messagebox
 import random
 import time
 import threading
+import queue
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; without it frame CRCs are computed one at a time and the channel uses random
+    np = None
+
+_BYTE_BITS = tuple(format(i, '08b') for i in range(256)) # 8-bit string for every byte value
 
 # --- Helper Functions for Data Link Layer Simulation ---
 
-def generate_crc(data_bits, polynomial_bits):
+_CRC_TABLES = {} # Byte-wise lookup tables, keyed by polynomial bit string
+_CRC_ARRAYS = {} # uint64 copies of _CRC_TABLES for batch_crc
+_CRC_FUNCS = {} # Frame CRC functions for bytes payloads, keyed by polynomial bit string
+
+def _poly_mod(x, polynomial):
     """
-    Generates a Cyclic Redundancy Check (CRC) checksum for given data.
-    This is a simplified CRC calculation for demonstration purposes.
+    Returns x mod polynomial over GF(2), with both operands held as Python ints.
     """
-    data = [int(b) for b in data_bits]
-    polynomial = [int(b) for b in polynomial_bits]
-    n = len(polynomial)
+    n = polynomial.bit_length()
+    for i in range(x.bit_length() - 1, n - 2, -1):
+        if (x >> i) & 1:
+            x ^= polynomial << (i - n + 1)
+    return x
 
-    temp_data = list(data) + [0] * (n - 1)
+def _build_crc_table(polynomial, width):
+    """
+    Builds a 256-entry table holding the remainder of (byte * x^width) mod polynomial.
+    """
+    return [_poly_mod(i << width, polynomial) for i in range(256)]
+
+def _crc_table(polynomial_bits):
+    """Returns the (cached) lookup table for the given polynomial."""
+    table = _CRC_TABLES.get(polynomial_bits)
+    if table is None:
+        table = _build_crc_table(int(polynomial_bits, 2), len(polynomial_bits) - 1)
+        _CRC_TABLES[polynomial_bits] = table
+    return table
+
+def _crc_array(polynomial_bits):
+    """Returns the (cached) lookup table for the given polynomial as a uint64 array."""
+    table = _CRC_ARRAYS.get(polynomial_bits)
+    if table is None:
+        table = np.array(_crc_table(polynomial_bits), np.uint64)
+        _CRC_ARRAYS[polynomial_bits] = table
+    return table
+
+def _specialize_crc(table, width):
+    """
+    Generates and compiles a byte-wise CRC function for one polynomial,
+    with its table, shift and mask baked in as constants.
+    """
+    if width > 8:
+        step = f"TABLE[(crc >> {width - 8}) ^ b] ^ ((crc << 8) & {(1 << width) - 1})"
+    elif width == 8:
+        step = "TABLE[crc ^ b]"
+    else: # Nothing of the old register survives below bit 8, so only the lookup is left
+        step = f"TABLE[(crc << {8 - width}) ^ b]"
+    source = ("def crc(payload_bytes):\n"
+              "    crc = 0\n"
+              "    for b in payload_bytes:\n"
+              f"        crc = {step}\n"
+              "    return crc\n")
+    namespace = {}
+    exec(source, {"TABLE": tuple(table)}, namespace)
+    return namespace["crc"]
+
+def _frame_crc_func(polynomial_bits):
+    """Returns the (cached) CRC function for bytes payloads, specialized by _specialize_crc."""
+    func = _CRC_FUNCS.get(polynomial_bits)
+    if func is None:
+        func = _specialize_crc(_crc_table(polynomial_bits), len(polynomial_bits) - 1)
+        _CRC_FUNCS[polynomial_bits] = func
+    return func
+
+def batch_crc(payloads, table, width):
+    """
+    Computes the CRC of every row of a (num_frames, frame_len) uint8 array at once.
+    Runs the same byte-wise recurrence as the _specialize_crc functions, one column per iteration.
+    The registers are uint64 and shift left by 8, so the CRC width must be at most 56.
+    """
+    mask = (1 << width) - 1
+    crc = np.zeros(payloads.shape[0], np.uint64)
+    for j in range(payloads.shape[1]):
+        crc = table[((crc << 8) >> width) ^ payloads[:, j]] ^ ((crc << 8) & mask)
+    return crc
 
-    for i in range(len(data)):
-        if temp_data[i] == 1:
-            for j in range(n):
-                temp_data[i + j] = temp_data[i + j] ^ polynomial[j]
+def _bits_to_bytes(bits):
+    """
+    Packs a '0'/'1' string into bytes, left-padding with zero bits.
+    Leading zero bits do not change a CRC remainder, so the packed bytes have the same CRC.
+    """
+    return int(bits, 2).to_bytes((len(bits) + 7) // 8, 'big') if bits else b''
 
-    crc = "".join(str(b) for b in temp_data[len(data):])
-    return crc
+def _format_bits(frame):
+    """Renders a bytes frame as space-separated 8-bit groups for logging."""
+    return ' '.join(_BYTE_BITS[b] for b in frame)
+
+def generate_crc(data_bits, polynomial_bits):
+    """
+    Generates a Cyclic Redundancy Check (CRC) checksum for given data.
+    This is a simplified CRC calculation for demonstration purposes.
+    """
+    reg = _frame_crc_func(polynomial_bits)(_bits_to_bytes(data_bits))
+    return format(reg, f'0{len(polynomial_bits) - 1}b')
 
 def check_crc(received_data_with_crc, polynomial_bits):
     """
     Checks the CRC of received data.
     Returns True if no error detected, False otherwise.
     """
-    received_bits = [int(b) for b in received_data_with_crc]
-    polynomial = [int(b) for b in polynomial_bits]
-    n = len(polynomial)
-
-    temp_received = list(received_bits)
-
-    for i in range(len(received_bits) - n + 1):
-        if temp_received[i] == 1:
-            for j in range(n):
-                temp_received[i + j] = temp_received[i + j] ^ polynomial[j]
-
-    remainder = "".join(str(b) for b in temp_received[len(received_bits) - n + 1:])
-    return int(remainder) == 0
+    width = len(polynomial_bits) - 1
+    data_bits = received_data_with_crc[:-width]
+    received_crc = int(received_data_with_crc[-width:], 2)
+    return _frame_crc_func(polynomial_bits)(_bits_to_bytes(data_bits)) == received_crc
 
 # --- Data Link Layer Components ---
 
@@ -50,64 +125,85 @@ class DataLinkLayerNode:
     """
     Represents a node (Sender or Receiver) in the Data Link Layer.
     """
-    def __init__(self, name, gui_logger, polynomial="1011"):
+    def __init__(self, name, log_buf, polynomial="1011"):
         self.name = name
         self.polynomial = polynomial
+        self._crc_width = len(polynomial) - 1
+        self._crc_len = (self._crc_width + 7) // 8 # CRC bytes at the end of each frame
+        self._crc = _frame_crc_func(polynomial) # CRC of a bytes payload
         self.send_buffer = []
         self.next_frame_to_send = 0
         self.expected_frame_ack = 0
         self.window_size = 3
-        self.received_frames = {}
+        # Out-of-order frames, indexed by sequence_number % window_size; bit i of _rx_present marks slot i as filled
+        self._rx_ring = [None] * self.window_size
+        self._rx_present = 0
+        self._rx_handlers = (self._on_duplicate, self._on_in_order, self._on_out_of_order)
         self.next_frame_to_deliver = 0
-        self.gui_logger = gui_logger # Reference to the GUI's log area
+        self.delivered_data = "" # Everything passed up to the Network Layer so far
+        self.send_frames = [] # Framed send_buffer, filled once by precompute_frames
+        self._log_buf = log_buf # Shared with SimWorker, which flushes it to the GUI
 
     def log(self, message):
-        """Logs messages to the GUI's text area."""
-        self.gui_logger.config(state=tk.NORMAL) # Enable writing
-        self.gui_logger.insert(tk.END, f"[{self.name}] {message}\n")
-        self.gui_logger.see(tk.END) # Auto-scroll to the end
-        self.gui_logger.config(state=tk.DISABLED) # Disable writing
+        """Buffers a log message for the GUI's text area."""
+        self._log_buf.append(f"[{self.name}] {message}\n")
 
-    def frame_data(self, data, sequence_number):
+    def precompute_frames(self):
         """
-        Performs framing: adds sequence number and CRC to the data.
-        Frame format: [Sequence_Number (2 bits)] + [Data] + [CRC (3 bits)]
+        Frames every character in send_buffer once, computing the CRCs in one batch.
         """
-        seq_num_binary = bin(sequence_number % 4)[2:].zfill(2)
-        data_bits = ''.join(format(ord(char), '08b') for char in data)
-        frame_payload = seq_num_binary + data_bits
-        crc = generate_crc(frame_payload, self.polynomial)
-        frame = frame_payload + crc
-        self.log(f"Framing data '{data}' (Seq:{sequence_number}) -> Payload: '{frame_payload}' -> CRC: '{crc}' -> Full Frame: '{frame}'")
-        return frame
+        if np is None or self._crc_width > 56: # batch_crc's uint64 registers would drop high bits
+            crcs = [self._crc(bytes([i & 3, ord(char)])) for i, char in enumerate(self.send_buffer)]
+        else:
+            payloads = np.empty((len(self.send_buffer), 2), np.uint8)
+            payloads[:, 0] = np.arange(len(self.send_buffer)) & 3
+            payloads[:, 1] = np.frombuffer(''.join(self.send_buffer).encode('latin-1'), np.uint8)
+            crcs = batch_crc(payloads, _crc_array(self.polynomial), self._crc_width).tolist()
+        self.send_frames = [self._build_frame(char, i, crc)
+                            for i, (char, crc) in enumerate(zip(self.send_buffer, crcs))]
+
+    def _build_frame(self, data, sequence_number, crc):
+        """
+        Performs framing: adds sequence number and the precomputed CRC to the data.
+        Frame format (bytes): [Sequence_Number (1 byte)] + [Data (1 byte per char)] + [CRC]
+        """
+        return bytes([sequence_number & 3]) + data.encode('latin-1') + crc.to_bytes(self._crc_len, 'big')
+
+    def log_framing(self, data, sequence_number, frame):
+        """Logs how data was framed, showing the payload, CRC and full frame as bits."""
+        crc = int.from_bytes(frame[-self._crc_len:], 'big')
+        self.log(f"Framing data '{data}' (Seq:{sequence_number}) -> Payload: '{_format_bits(frame[:-self._crc_len])}' -> CRC: '{format(crc, f'0{self._crc_width}b')}' -> Full Frame: '{_format_bits(frame)}'")
 
     def unframe_data(self, frame):
         """
         Extracts data and checks CRC from a received frame.
         Returns (sequence_number, data, is_corrupted)
         """
-        if len(frame) < len(self.polynomial) - 1 + 2:
-            self.log(f"Received frame too short: {frame}")
+        if len(frame) < self._crc_len + 1:
+            self.log(f"Received frame too short: {_format_bits(frame)}")
             return None, None, True
 
-        is_corrupted = not check_crc(frame, self.polynomial)
+        is_corrupted = self._crc(frame[:-self._crc_len]) != int.from_bytes(frame[-self._crc_len:], 'big')
         if is_corrupted:
-            self.log(f"CRC Check Failed for frame: {frame} -> Frame is CORRUPTED!")
+            self.log(f"CRC Check Failed for frame: {_format_bits(frame)} -> Frame is CORRUPTED!")
             return None, None, True
 
-        seq_num_binary = frame[0:2]
-        data_bits = frame[2:-len(self.polynomial)+1]
-        
-        sequence_number = int(seq_num_binary, 2)
-        data = ""
-        for i in range(0, len(data_bits), 8):
-            byte = data_bits[i:i+8]
-            if byte:
-                data += chr(int(byte, 2))
-
-        self.log(f"Unframing frame: {frame} -> Seq: {sequence_number}, Data: '{data}', CRC OK.")
+        frame_payload = frame[:-self._crc_len]
+        sequence_number = frame_payload[0]
+        data = frame_payload[1:].decode('latin-1')
+
+        self.log(f"Unframing frame: {_format_bits(frame)} -> Seq: {sequence_number}, Data: '{data}', CRC OK.")
         return sequence_number, data, False
 
+    def buffered_frames(self):
+        """
+        Returns the out-of-order frames waiting in the ring buffer as {sequence_number: data}.
+        They always lie within the window after next_frame_to_deliver.
+        """
+        return {seq: self._rx_ring[seq % self.window_size]
+                for seq in range(self.next_frame_to_deliver + 1, self.next_frame_to_deliver + self.window_size)
+                if self._rx_present & (1 << (seq % self.window_size))}
+
     def process_received_frame(self, sequence_number, data):
         """
         Processes a received frame at the receiver.
@@ -119,26 +215,212 @@ class DataLinkLayerNode:
 
         self.log(f"Received frame {sequence_number}. Expected: {self.next_frame_to_deliver}")
 
-        if sequence_number == self.next_frame_to_deliver:
-            self.log(f"Frame {sequence_number} is in order. Delivering '{data}' to Network Layer.")
+        # Dispatch on cmp(sequence_number, next_frame_to_deliver): -1 duplicate, 0 in order, 1 out of order
+        expected = self.next_frame_to_deliver
+        return self._rx_handlers[(sequence_number > expected) - (sequence_number < expected) + 1](sequence_number, data)
+
+    def _on_in_order(self, sequence_number, data):
+        """Delivers an in-order frame plus any buffered frames it unblocks, and ACKs it."""
+        self.log(f"Frame {sequence_number} is in order. Delivering '{data}' to Network Layer.")
+        self.delivered_data += data
+        self.next_frame_to_deliver += 1
+        slot = self.next_frame_to_deliver % self.window_size
+        while self._rx_present & (1 << slot):
+            buffered_data = self._rx_ring[slot]
+            self._rx_ring[slot] = None
+            self._rx_present &= ~(1 << slot)
+            self.log(f"Delivering buffered frame {self.next_frame_to_deliver}: '{buffered_data}' to Network Layer.")
+            self.delivered_data += buffered_data
             self.next_frame_to_deliver += 1
-            ack_to_send = sequence_number
-            while self.next_frame_to_deliver in self.received_frames:
-                buffered_data = self.received_frames.pop(self.next_frame_to_deliver)
-                self.log(f"Delivering buffered frame {self.next_frame_to_deliver}: '{buffered_data}' to Network Layer.")
-                self.next_frame_to_deliver += 1
-            self.log(f"Sending ACK for {ack_to_send}")
-            return ack_to_send
-        elif sequence_number > self.next_frame_to_deliver:
-            self.log(f"Frame {sequence_number} is out of order. Buffering.")
-            self.received_frames[sequence_number] = data
-            ack_to_send = self.next_frame_to_deliver - 1 if self.next_frame_to_deliver > 0 else None
-            if ack_to_send is not None:
-                self.log(f"Sending cumulative ACK for {ack_to_send}")
-            return ack_to_send
+            slot = self.next_frame_to_deliver % self.window_size
+        self.log(f"Sending ACK for {sequence_number}")
+        return sequence_number
+
+    def _on_out_of_order(self, sequence_number, data):
+        """Buffers a frame that arrived ahead of the expected one and re-ACKs the last in-order frame."""
+        self.log(f"Frame {sequence_number} is out of order. Buffering.")
+        slot = sequence_number % self.window_size
+        self._rx_ring[slot] = data
+        self._rx_present |= 1 << slot
+        ack_to_send = self.next_frame_to_deliver - 1 if self.next_frame_to_deliver > 0 else None
+        if ack_to_send is not None:
+            self.log(f"Sending cumulative ACK for {ack_to_send}")
+        return ack_to_send
+
+    def _on_duplicate(self, sequence_number, data):
+        """Discards an already delivered frame and re-sends its ACK."""
+        self.log(f"Received duplicate frame {sequence_number}. Discarding and re-sending ACK for {sequence_number}.")
+        return sequence_number
+
+class SimWorker(threading.Thread):
+    """
+    Runs the sender/receiver state machine off the Tk main thread.
+    Log lines and status snapshots are posted to gui_q for the GUI to apply.
+    """
+    def __init__(self, simulation_data, gui_q):
+        super().__init__(daemon=True)
+        self.gui_q = gui_q
+        self.commands = queue.Queue()
+        self._log_buf = [] # Log lines of the current step, shared by both nodes and the channel
+        self.sender = DataLinkLayerNode("Sender", self._log_buf)
+        self.receiver = DataLinkLayerNode("Receiver", self._log_buf)
+        self.simulation_data = simulation_data
+        # Pre-drawn channel outcomes, one (loss, error, error position) row of uniforms per transmission
+        self._rng = np.random.default_rng() if np is not None else None
+        self._rng_draws = []
+        self._rng_ptr = 0
+
+    def request_step(self, introduce_error_flag, loss_prob):
+        """Queues one simulation step (called from the GUI thread)."""
+        self.commands.put((introduce_error_flag, loss_prob))
+
+    def stop(self):
+        """Makes the worker exit once its current step is done."""
+        self.commands.put(None)
+
+    def run(self):
+        # Prepare sender's buffer with all data to be sent
+        self.sender.send_buffer.extend(self.simulation_data)
+        self.sender.precompute_frames()
+        self._refill_rng()
+        self.sender.log(f"Sender ready to send data. Buffer: {self.sender.send_buffer}")
+        self._log_buf.append("\n--- Simulation Started ---\n")
+        self.flush_log()
+        self.post_status()
+
+        while True:
+            command = self.commands.get()
+            if command is None:
+                return
+            finished = self.step(*command)
+            self.flush_log()
+            if finished:
+                self.gui_q.put(("done", None))
+                return
+
+    def flush_log(self):
+        """Posts all buffered log lines to the GUI as a single message."""
+        if self._log_buf:
+            self.gui_q.put(("log", "".join(self._log_buf)))
+            self._log_buf.clear()
+
+    def post_status(self):
+        """Posts a snapshot of the sender and receiver state for the status labels."""
+        self.gui_q.put(("status", {
+            "send_buffer": list(self.sender.send_buffer),
+            "next_frame_to_send": self.sender.next_frame_to_send,
+            "expected_frame_ack": self.sender.expected_frame_ack,
+            "next_frame_to_deliver": self.receiver.next_frame_to_deliver,
+            "buffered_frames": self.receiver.buffered_frames(),
+            "delivered_data": self.receiver.delivered_data,
+        }))
+
+    def _refill_rng(self):
+        """Draws the next block of channel outcomes from NumPy's generator (four per character of data)."""
+        if self._rng is not None:
+            self._rng_draws = self._rng.random((len(self.simulation_data) * 4, 3)).tolist()
+            self._rng_ptr = 0
+
+    def _next_draws(self):
+        """Returns the (loss, error, error position) uniforms for one transmission."""
+        if self._rng is None:
+            return random.random(), random.random(), random.random()
+        if self._rng_ptr == len(self._rng_draws):
+            self._refill_rng()
+        draws = self._rng_draws[self._rng_ptr]
+        self._rng_ptr += 1
+        return draws
+
+    def log_channel_message(self, message):
+        """Buffers a channel message for the GUI's text area."""
+        self._log_buf.append(f"  [Channel] {message}\n")
+
+    def simulate_channel(self, frame, introduce_error_flag, loss_prob):
+        """
+        Simulates a noisy communication channel.
+        """
+        self.log_channel_message(f"Sending frame: {_format_bits(frame)}")
+        time.sleep(0.1) # Simulate transmission delay (reduced for faster steps)
+
+        loss_draw, error_draw, position_draw = self._next_draws()
+        if loss_draw < loss_prob:
+            self.log_channel_message("!!! Frame lost in transit !!!")
+            return None
+
+        if introduce_error_flag and error_draw < 0.3:
+            error_index = int(position_draw * len(frame) * 8) # Bit index, MSB first as logged
+            error_mask = 0x80 >> (error_index & 7)
+            original_bit = 1 if frame[error_index >> 3] & error_mask else 0
+            corrupted_frame = bytearray(frame)
+            corrupted_frame[error_index >> 3] ^= error_mask
+            self.log_channel_message(f"!!! Bit error introduced at index {error_index} (changed {original_bit} to {original_bit ^ 1}) !!!")
+            return bytes(corrupted_frame)
+        return frame
+
+    def step(self, introduce_error_flag, loss_prob):
+        """
+        Runs one simulation step. Returns True once all data has been sent and acknowledged.
+        """
+        # Check if there are frames left to send or ACKs to receive
+        # This condition determines if the simulation should continue.
+        # It's simplified for step-by-step; in a real continuous sim,
+        # timers would trigger retransmissions.
+        can_send_new_frame = (self.sender.next_frame_to_send < len(self.sender.send_buffer) and \
+                             self.sender.next_frame_to_send < self.sender.expected_frame_ack + self.sender.window_size)
+        
+        # In this step-by-step simulation, we prioritize sending if possible,
+        # otherwise, we indicate waiting for ACKs.
+        if can_send_new_frame:
+            data_char = self.sender.send_buffer[self.sender.next_frame_to_send]
+            frame_to_send = self.sender.send_frames[self.sender.next_frame_to_send]
+            self.sender.log_framing(data_char, self.sender.next_frame_to_send, frame_to_send)
+            
+            # Simulate channel transmission for the data frame
+            received_frame_at_receiver = self.simulate_channel(frame_to_send, introduce_error_flag, loss_prob)
+
+            if received_frame_at_receiver is not None:
+                seq_num, data_unframed, is_corrupted = self.receiver.unframe_data(received_frame_at_receiver)
+                if not is_corrupted:
+                    ack_num_from_receiver = self.receiver.process_received_frame(seq_num, data_unframed)
+                    
+                    # Simulate channel transmission for the ACK
+                    if ack_num_from_receiver is not None:
+                        ack_frame = f"ACK-{ack_num_from_receiver}" # Simplified ACK frame
+                        self.log_channel_message(f"Sending ACK: {ack_frame}")
+                        time.sleep(0.1) # Simulate ACK transmission delay
+
+                        # Assume ACK reaches sender (no loss/corruption for ACK in this simplified model)
+                        self.sender.log(f"Received ACK for frame {ack_num_from_receiver}")
+                        if ack_num_from_receiver >= self.sender.expected_frame_ack:
+                            self.sender.expected_frame_ack = ack_num_from_receiver + 1
+                            self.sender.log(f"Sender window base moved to {self.sender.expected_frame_ack}")
+                    else:
+                        self.sender.log(f"No valid ACK generated by receiver (due to out-of-order or duplicate frame).")
+                else:
+                    self.sender.log(f"Corrupted data frame received by receiver. Sender will retransmit after timeout (simulated).")
+            else:
+                self.sender.log(f"Data frame lost in transit. Sender will retransmit after timeout (simulated).")
+            
+            # Increment next_frame_to_send only if a new frame was actually attempted to be sent
+            self.sender.next_frame_to_send += 1
+
         else:
-            self.log(f"Received duplicate frame {sequence_number}. Discarding and re-sending ACK for {sequence_number}.")
-            return sequence_number
+            # If no new frames can be sent, check if all outstanding frames are acknowledged
+            if self.sender.expected_frame_ack < len(self.sender.send_buffer):
+                self.sender.log(f"No new frames to send within window. Waiting for ACKs. "
+                                f"Window: [{self.sender.expected_frame_ack}, {self.sender.expected_frame_ack + self.sender.window_size - 1}]")
+                # In a real protocol, a timeout would retransmit unacknowledged frames here.
+                # For this step-by-step GUI, the user clicks "Next Step" to advance.
+            else:
+                self.sender.log(f"All data sent and acknowledged.")
+                return True # Exit early if simulation finished
+
+        self.post_status()
+
+        # Check for global completion after each step
+        return self.sender.expected_frame_ack == len(self.sender.send_buffer) and \
+               self.receiver.next_frame_to_deliver == len(self.simulation_data)
+
 
 class DataLinkSimulatorGUI:
     def __init__(self, master):
@@ -147,14 +429,15 @@ class DataLinkSimulatorGUI:
         master.geometry("800x700")
         master.configure(bg="#e0f7fa") # Light blue background
 
-        self.sender = None
-        self.receiver = None
+        self.worker = None
+        self.gui_q = queue.Queue()
         self.simulation_data = []
         self.simulation_index = 0
         self.is_running = False
 
         self.create_widgets()
         self.reset_simulation()
+        self.master.after(50, self._drain_queue)
 
     def create_widgets(self):
         # Title
@@ -222,60 +505,80 @@ class DataLinkSimulatorGUI:
 
         self.log_text = scrolledtext.ScrolledText(log_frame, width=80, height=15, font=("Inter", 9), wrap=tk.WORD, bd=2, relief="sunken")
         self.log_text.pack(fill=tk.BOTH, expand=True)
-        self.log_text.config(state=tk.DISABLED) # Make it read-only
-
-    def update_status_labels(self):
-        """Updates the sender and receiver status labels in the GUI."""
-        if self.sender:
-            self.sender_buffer_label.config(text=f"Buffer: {self.sender.send_buffer}")
-            self.sender_seq_label.config(text=f"Next Frame to Send: {self.sender.next_frame_to_send}")
-            self.sender_ack_label.config(text=f"Expected ACK: {self.sender.expected_frame_ack}")
-        else: # Clear labels if sender is None (e.g., after reset)
+        # Make it read-only without toggling its state on every write: swallow the keys and the
+        # virtual events that edit text, including <<PasteSelection>>, which Tk fires on
+        # middle-button release. Navigation, copy and focus traversal still work.
+        self.log_text.bind("<Key>", self._on_log_key)
+        for virtual_event in ("<<PasteSelection>>", "<<Paste>>", "<<Cut>>", "<<Clear>>"):
+            self.log_text.bind(virtual_event, lambda event: "break")
+
+    def _on_log_key(self, event):
+        """Blocks key presses that would edit the log and moves focus on Tab / Shift-Tab."""
+        if event.keysym in ("Tab", "ISO_Left_Tab"):
+            # The Text class binding inserts a tab character instead of traversing focus
+            if event.keysym == "ISO_Left_Tab" or event.state & 0x1:
+                target = event.widget.tk_focusPrev()
+            else:
+                target = event.widget.tk_focusNext()
+            if target is not None:
+                target.focus_set()
+            return "break"
+        if event.keysym in ("BackSpace", "Delete", "Return", "KP_Enter", "Insert"):
+            return "break"
+        if event.state & (0x4 | 0x8):
+            # Control, or Alt/Meta (Command on macOS): copy, select-all and the rest pass through;
+            # only the Emacs-style shortcuts of the Text class edit text
+            return "break" if event.keysym.lower() in ("d", "h", "i", "k", "o", "t") else None
+        if event.char and event.char.isprintable():
+            return "break"
+        return None
+
+    def update_status_labels(self, status=None):
+        """Updates the sender and receiver status labels from a SimWorker status snapshot."""
+        if status:
+            self.sender_buffer_label.config(text=f"Buffer: {status['send_buffer']}")
+            self.sender_seq_label.config(text=f"Next Frame to Send: {status['next_frame_to_send']}")
+            self.sender_ack_label.config(text=f"Expected ACK: {status['expected_frame_ack']}")
+        else: # Clear labels if there is no simulation (e.g., after reset)
             self.sender_buffer_label.config(text="Buffer: []")
             self.sender_seq_label.config(text="Next Frame to Send: 0")
             self.sender_ack_label.config(text="Expected ACK: 0")
 
 
-        if self.receiver:
-            self.receiver_expected_label.config(text=f"Expected Frame to Deliver: {self.receiver.next_frame_to_deliver}")
-            self.receiver_buffered_label.config(text=f"Buffered Frames: {self.receiver.received_frames}")
-            # Accumulate delivered data for display
-            delivered_data_str = "".join(self.simulation_data[:self.receiver.next_frame_to_deliver])
-            self.receiver_delivered_label.config(text=f"Delivered Data: '{delivered_data_str}'")
-        else: # Clear labels if receiver is None (e.g., after reset)
+        if status:
+            self.receiver_expected_label.config(text=f"Expected Frame to Deliver: {status['next_frame_to_deliver']}")
+            self.receiver_buffered_label.config(text=f"Buffered Frames: {status['buffered_frames']}")
+            self.receiver_delivered_label.config(text=f"Delivered Data: '{status['delivered_data']}'")
+        else: # Clear labels if there is no simulation (e.g., after reset)
             self.receiver_expected_label.config(text="Expected Frame to Deliver: 0")
             self.receiver_buffered_label.config(text="Buffered Frames: {}")
             self.receiver_delivered_label.config(text="Delivered Data: ''")
 
-
-    def log_channel_message(self, message):
-        """Logs channel messages to the GUI's text area."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"  [Channel] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-
-    def simulate_channel_gui(self, frame, introduce_error_flag, loss_prob):
-        """
-        Simulates a noisy communication channel, updating GUI.
-        """
-        self.log_channel_message(f"Sending frame: {frame}")
-        time.sleep(0.1) # Simulate transmission delay (reduced for faster steps)
-
-        if random.random() < loss_prob:
-            self.log_channel_message("!!! Frame lost in transit !!!")
-            return None
-
-        if introduce_error_flag and random.random() < 0.3:
-            error_index = random.randint(0, len(frame) - 1)
-            original_char = frame[error_index]
-            corrupted_char = '1' if original_char == '0' else '0'
-            corrupted_frame = list(frame)
-            corrupted_frame[error_index] = corrupted_char
-            corrupted_frame_str = "".join(corrupted_frame)
-            self.log_channel_message(f"!!! Bit error introduced at index {error_index} (changed {original_char} to {corrupted_char}) !!!")
-            return corrupted_frame_str
-        return frame
+    def _drain_queue(self):
+        """Applies updates posted by the simulation worker, batching log lines into one insert."""
+        batch = []
+        status = None
+        done = False
+        try:
+            while True:
+                kind, payload = self.gui_q.get_nowait()
+                if kind == "log":
+                    batch.append(payload)
+                elif kind == "status":
+                    status = payload
+                elif kind == "done":
+                    done = True
+        except queue.Empty:
+            pass
+
+        if batch:
+            self.log_text.insert(tk.END, "".join(batch))
+            self.log_text.see(tk.END) # Auto-scroll to the end
+        if status is not None:
+            self.update_status_labels(status)
+        if done:
+            self.end_simulation()
+        self.master.after(50, self._drain_queue)
 
     def start_simulation(self):
         if self.is_running:
@@ -285,6 +588,11 @@ class DataLinkSimulatorGUI:
         if not data_input:
             messagebox.showwarning("Input Error", "Please enter data to send.")
             return
+        try:
+            data_input.encode('latin-1')
+        except UnicodeEncodeError:
+            messagebox.showwarning("Input Error", "Data must only contain Latin-1 characters.")
+            return
 
         try:
             loss_prob = float(self.loss_probability_entry.get())
@@ -294,13 +602,11 @@ class DataLinkSimulatorGUI:
             messagebox.showwarning("Input Error", "Loss probability must be a number between 0.0 and 1.0.")
             return
 
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
 
-        self.sender = DataLinkLayerNode("Sender", self.log_text)
-        self.receiver = DataLinkLayerNode("Receiver", self.log_text)
         self.simulation_data = list(data_input) # Convert string to list of characters
+        self.gui_q = queue.Queue() # Fresh queue so a stopped worker's late messages are dropped
+        self.worker = SimWorker(self.simulation_data, self.gui_q)
         self.simulation_index = 0
         self.is_running = True
 
@@ -310,88 +616,18 @@ class DataLinkSimulatorGUI:
         self.introduce_error_checkbox.config(state=tk.DISABLED)
         self.loss_probability_entry.config(state=tk.DISABLED)
 
-        # Prepare sender's buffer with all data to be sent
-        self.sender.send_buffer.extend(self.simulation_data)
-        self.sender.log(f"Sender ready to send data. Buffer: {self.sender.send_buffer}")
-        self.update_status_labels()
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, "\n--- Simulation Started ---\n")
-        self.log_text.config(state=tk.DISABLED)
+        self.worker.start()
 
     def next_simulation_step(self):
         if not self.is_running:
             return
 
-        introduce_error_flag = self.introduce_error_var.get()
-        loss_prob = float(self.loss_probability_entry.get())
-
-        # Check if there are frames left to send or ACKs to receive
-        # This condition determines if the simulation should continue.
-        # It's simplified for step-by-step; in a real continuous sim,
-        # timers would trigger retransmissions.
-        can_send_new_frame = (self.sender.next_frame_to_send < len(self.sender.send_buffer) and \
-                             self.sender.next_frame_to_send < self.sender.expected_frame_ack + self.sender.window_size)
-        
-        # In this step-by-step simulation, we prioritize sending if possible,
-        # otherwise, we indicate waiting for ACKs.
-        if can_send_new_frame:
-            data_char = self.sender.send_buffer[self.sender.next_frame_to_send]
-            frame_to_send = self.sender.frame_data(data_char, self.sender.next_frame_to_send)
-            
-            # Simulate channel transmission for the data frame
-            received_frame_at_receiver = self.simulate_channel_gui(frame_to_send, introduce_error_flag, loss_prob)
-
-            if received_frame_at_receiver is not None:
-                seq_num, data_unframed, is_corrupted = self.receiver.unframe_data(received_frame_at_receiver)
-                if not is_corrupted:
-                    ack_num_from_receiver = self.receiver.process_received_frame(seq_num, data_unframed)
-                    
-                    # Simulate channel transmission for the ACK
-                    if ack_num_from_receiver is not None:
-                        ack_frame = f"ACK-{ack_num_from_receiver}" # Simplified ACK frame
-                        self.log_channel_message(f"Sending ACK: {ack_frame}")
-                        time.sleep(0.1) # Simulate ACK transmission delay
-
-                        # Assume ACK reaches sender (no loss/corruption for ACK in this simplified model)
-                        self.sender.log(f"Received ACK for frame {ack_num_from_receiver}")
-                        if ack_num_from_receiver >= self.sender.expected_frame_ack:
-                            self.sender.expected_frame_ack = ack_num_from_receiver + 1
-                            self.sender.log(f"Sender window base moved to {self.sender.expected_frame_ack}")
-                    else:
-                        self.sender.log(f"No valid ACK generated by receiver (due to out-of-order or duplicate frame).")
-                else:
-                    self.sender.log(f"Corrupted data frame received by receiver. Sender will retransmit after timeout (simulated).")
-            else:
-                self.sender.log(f"Data frame lost in transit. Sender will retransmit after timeout (simulated).")
-            
-            # Increment next_frame_to_send only if a new frame was actually attempted to be sent
-            self.sender.next_frame_to_send += 1
-
-        else:
-            # If no new frames can be sent, check if all outstanding frames are acknowledged
-            if self.sender.expected_frame_ack < len(self.sender.send_buffer):
-                self.sender.log(f"No new frames to send within window. Waiting for ACKs. "
-                                f"Window: [{self.sender.expected_frame_ack}, {self.sender.expected_frame_ack + self.sender.window_size - 1}]")
-                # In a real protocol, a timeout would retransmit unacknowledged frames here.
-                # For this step-by-step GUI, the user clicks "Next Step" to advance.
-            else:
-                self.sender.log(f"All data sent and acknowledged.")
-                self.end_simulation()
-                return # Exit early if simulation finished
-
-        self.update_status_labels()
-
-        # Check for global completion after each step
-        if self.sender.expected_frame_ack == len(self.sender.send_buffer) and \
-           self.receiver.next_frame_to_deliver == len(self.simulation_data):
-            self.end_simulation()
-
+        # Tk variables are read here on the main thread; the worker only sees plain values.
+        self.worker.request_step(self.introduce_error_var.get(), float(self.loss_probability_entry.get()))
 
     def end_simulation(self):
         self.is_running = False
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.insert(tk.END, "\n--- Simulation Finished ---\n")
-        self.log_text.config(state=tk.DISABLED)
         self.next_step_button.config(state=tk.DISABLED)
         self.start_button.config(state=tk.NORMAL) # Re-enable start button for new simulation
         messagebox.showinfo("Simulation Complete", "All data has been sent and acknowledged.")
@@ -399,15 +635,15 @@ class DataLinkSimulatorGUI:
 
     def reset_simulation(self):
         self.is_running = False
-        self.sender = None
-        self.receiver = None
+        if self.worker:
+            self.worker.stop()
+        self.worker = None
+        self.gui_q = queue.Queue()
         self.simulation_data = []
         self.simulation_index = 0
 
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.insert(tk.END, "Simulation ready. Enter data and click 'Start Simulation'.\n")
-        self.log_text.config(state=tk.DISABLED)
 
         self.data_entry.config(state=tk.NORMAL)
         self.data_entry.delete(0, tk.END)